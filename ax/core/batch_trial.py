@@ -23,7 +23,7 @@ from typing import (
 import numpy as np
 from ax.core.arm import Arm
 from ax.core.base_trial import BaseTrial
-from ax.core.generator_run import ArmWeight, GeneratorRun, GeneratorRunType
+from ax.core.generator_run import GeneratorRun, GeneratorRunType
 from ax.core.trial import immutable_once_run
 from ax.core.types import TCandidateMetadata
 from ax.utils.common.base import SortableBase
@@ -263,10 +263,10 @@ class BatchTrial(BaseTrial):
             self.experiment.search_space.check_types(arm.parameters, raise_error=True)
 
         # Clone arms to avoid mutating existing state
-        generator_run._arm_weight_table = OrderedDict(
-            {
-                arm_sig: ArmWeight(arm_weight.arm.clone(), arm_weight.weight)
-                for arm_sig, arm_weight in generator_run._arm_weight_table.items()
+        generator_run._set_arm_weight_table(
+            arm_weight_table={
+                arm_sig: (arm.clone(), weight)
+                for arm_sig, (arm, weight) in generator_run._arm_weight_table.items()
             }
         )
 
@@ -944,8 +944,8 @@ class Experiment(Base):
 
         # If arm is identical to an existing arm, return that
         # so that the names match.
-        if arm.signature in self.arms_by_signature:
-            existing_arm = self.arms_by_signature[arm.signature]
+        existing_arm = self.arms_by_signature.get(arm.signature)
+        if existing_arm is not None:
             if arm.has_name:
                 if arm.name != existing_arm.name:
                     raise ValueError(
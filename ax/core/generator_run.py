@@ -6,11 +6,9 @@
 
 from __future__ import annotations
 
-import copy
-from collections import OrderedDict
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, MutableMapping, NamedTuple, Optional, Set, Tuple
+from typing import Any, Dict, FrozenSet, List, MutableMapping, Optional, Tuple
 
 import pandas as pd
 from ax.core.arm import Arm
@@ -23,6 +21,7 @@ from ax.core.types import (
     TModelPredictArm,
 )
 from ax.utils.common.base import SortableBase
+from ax.utils.common.equality import equality_typechecker, object_attribute_dicts_equal
 from ax.utils.common.typeutils import not_none
 
 
@@ -33,13 +32,6 @@ class GeneratorRunType(Enum):
     MANUAL = 1
 
 
-class ArmWeight(NamedTuple):
-    """NamedTuple for tying together arms and weights."""
-
-    arm: Arm
-    weight: float
-
-
 def extract_arm_predictions(
     model_predictions: TModelPredict, arm_idx: int
 ) -> TModelPredictArm:
@@ -53,19 +45,132 @@ def extract_arm_predictions(
         (mean, cov) for specified arm.
     """
 
-    means = model_predictions[0]
-    covariances = model_predictions[1]
-    means_per_arm = {metric: means[metric][arm_idx] for metric in means.keys()}
+    means, covariances = model_predictions
+    means_per_arm = {metric: values[arm_idx] for metric, values in means.items()}
     covar_per_arm = {
         metric: {
-            other_metric: covariances[metric][other_metric][arm_idx]
-            for other_metric in covariances[metric].keys()
+            other_metric: values[arm_idx] for other_metric, values in covar.items()
         }
-        for metric in covariances.keys()
+        for metric, covar in covariances.items()
     }
     return (means_per_arm, covar_per_arm)
 
 
+def extract_all_arm_predictions(
+    model_predictions: TModelPredict, num_arms: int
+) -> List[TModelPredictArm]:
+    """Extract predictions for all arms from model_predictions at once.
+
+    Equivalent to calling `extract_arm_predictions` for each of the first
+    `num_arms` arm indices, but transposes each per-metric list only once.
+
+    Args:
+        model_predictions: Mean and Cov for all arms.
+        num_arms: Number of arms to extract predictions for.
+
+    Returns:
+        List of (mean, cov) for each arm, in the order of the prediction lists.
+    """
+    means, covariances = model_predictions
+    means_per_arm = _transpose_metric_lists(means, num_arms=num_arms)
+    covar_per_metric = {
+        metric: _transpose_metric_lists(covariances[metric], num_arms=num_arms)
+        for metric in covariances.keys()
+    }
+    return [
+        (
+            means_per_arm[arm_idx],
+            {
+                metric: covar_per_arm[arm_idx]
+                for metric, covar_per_arm in covar_per_metric.items()
+            },
+        )
+        for arm_idx in range(num_arms)
+    ]
+
+
+def _transpose_metric_lists(
+    values_by_metric: Dict[str, List[float]], num_arms: int
+) -> List[Dict[str, float]]:
+    """Turn a mapping from metric to per-arm values into a list of
+    per-arm mappings from metric to value.
+    """
+    if not values_by_metric:
+        return [{} for _ in range(num_arms)]
+    metrics = list(values_by_metric.keys())
+    return [dict(zip(metrics, values)) for values in zip(*values_by_metric.values())]
+
+
+def _copy_model_predictions(model_predictions: TModelPredict) -> TModelPredict:
+    """Copy model predictions without going through `copy.deepcopy`, relying
+    on the fixed structure of `TModelPredict`.
+    """
+    means, covariances = model_predictions
+    return (
+        {metric: values.copy() for metric, values in means.items()},
+        {
+            metric: {
+                other_metric: values.copy() for other_metric, values in covar.items()
+            }
+            for metric, covar in covariances.items()
+        },
+    )
+
+
+def _copy_arm_predictions(predictions: TModelPredictArm) -> TModelPredictArm:
+    """Copy the predictions for a single arm without going through
+    `copy.deepcopy`, relying on the fixed structure of `TModelPredictArm`.
+    """
+    means, covariances = predictions
+    return (
+        dict(means),
+        None
+        if covariances is None
+        else {metric: dict(covar) for metric, covar in covariances.items()},
+    )
+
+
+def _copy_best_arm_predictions(
+    best_arm_predictions: Tuple[Arm, Optional[TModelPredictArm]]
+) -> Tuple[Arm, Optional[TModelPredictArm]]:
+    """Copy best arm predictions without going through `copy.deepcopy`,
+    relying on the fixed structure of `TModelPredictArm`.
+    """
+    best_arm, predictions = best_arm_predictions
+    if predictions is None:
+        return best_arm.clone(), None
+    return best_arm.clone(), _copy_arm_predictions(predictions)
+
+
+def _merge_arm_weights(
+    signatures: List[str], arms: List[Arm], weights: List[float]
+) -> Dict[str, Tuple[Arm, float]]:
+    """Build a mapping from arm signature to an (arm, weight) tuple, summing
+    the weights of arms that share a signature.
+    """
+    # Insert all keys up front, so that the loop below only overwrites values
+    # and the table does not need to grow while it is being filled in.
+    arm_weight_table: Dict[str, Optional[Tuple[Arm, float]]] = dict.fromkeys(signatures)
+    for signature, arm, weight in zip(signatures, arms, weights):
+        existing_cw = arm_weight_table[signature]
+        arm_weight_table[signature] = (
+            arm,
+            weight if existing_cw is None else existing_cw[1] + weight,
+        )
+    # pyre-ignore[7]: All values are set in the loop above.
+    return arm_weight_table
+
+
+# Attributes of `GeneratorRun` that are derived from its other attributes,
+# and so are not compared in equality checks.
+_DERIVED_ATTRIBUTES = (
+    "_arms",
+    "_weights",
+    "_arm_signatures",
+    "_total_weight",
+)
+
+
 class GeneratorRun(SortableBase):
     """An object that represents a single run of a generator.
 
@@ -76,6 +181,31 @@ class GeneratorRun(SortableBase):
     runs that were already attached to the trial.
     """
 
+    __slots__ = (
+        "_arm_weight_table",
+        "_arms",
+        "_weights",
+        "_arm_signatures",
+        "_total_weight",
+        "_generator_run_type",
+        "_time_created",
+        "_optimization_config",
+        "_search_space",
+        "_model_predictions",
+        "_best_arm_predictions",
+        "_index",
+        "_fit_time",
+        "_gen_time",
+        "_model_key",
+        "_model_kwargs",
+        "_bridge_kwargs",
+        "_gen_metadata",
+        "_model_state_after_gen",
+        "_candidate_metadata_by_arm_signature",
+        "_generation_step_index",
+        "_db_id",
+    )
+
     def __init__(
         self,
         arms: List[Arm],
@@ -138,10 +268,7 @@ class GeneratorRun(SortableBase):
                 to model-produced candidate metadata that corresponds to that arm in
                 this generator run.
         """
-        self._arm_weight_table: OrderedDict[str, ArmWeight] = OrderedDict()
-        if weights is None:
-            weights = [1.0 for i in range(len(arms))]
-        if len(arms) != len(weights):
+        if weights is not None and len(arms) != len(weights):
             raise ValueError("Weights and arms must have the same length.")
         if bridge_kwargs is not None or model_kwargs is not None:
             if model_key is None:
@@ -153,17 +280,23 @@ class GeneratorRun(SortableBase):
                     "Both model kwargs and bridge kwargs are required if either "
                     "one is provided."
                 )
-        for arm, weight in zip(arms, weights):
-            existing_cw = self._arm_weight_table.get(arm.signature)
-            if existing_cw:
-                self._arm_weight_table[arm.signature] = ArmWeight(
-                    arm=arm, weight=existing_cw.weight + weight
-                )
-            else:
-                self._arm_weight_table[arm.signature] = ArmWeight(
-                    arm=arm, weight=weight
+        signatures = [arm.signature for arm in arms]
+        if weights is None:
+            # Arms are usually unique, in which case there are no weights to merge.
+            arm_weight_table = {
+                signature: (arm, 1.0) for signature, arm in zip(signatures, arms)
+            }
+            if len(arm_weight_table) < len(arms):
+                arm_weight_table = _merge_arm_weights(
+                    signatures=signatures, arms=arms, weights=[1.0] * len(arms)
                 )
+        else:
+            arm_weight_table = _merge_arm_weights(
+                signatures=signatures, arms=arms, weights=weights
+            )
+        self._set_arm_weight_table(arm_weight_table=arm_weight_table)
 
+        self._db_id: Optional[int] = None
         self._generator_run_type: Optional[str] = type
         self._time_created: datetime = datetime.now()
         self._optimization_config = optimization_config
@@ -182,7 +315,8 @@ class GeneratorRun(SortableBase):
         # signatures in it correspond to arms in this generator run.
         if candidate_metadata_by_arm_signature:
             unknown_arms_in_cand_metadata = (
-                set(candidate_metadata_by_arm_signature.keys()) - self.arm_signatures
+                candidate_metadata_by_arm_signature.keys()
+                - self._arm_weight_table.keys()
             )
             if unknown_arms_in_cand_metadata:
                 raise ValueError(
@@ -198,24 +332,24 @@ class GeneratorRun(SortableBase):
     @property
     def arms(self) -> List[Arm]:
         """Returns arms generated by this run."""
-        return [cw.arm for cw in self._arm_weight_table.values()]
+        return list(self._arms)
 
     @property
-    def arm_signatures(self) -> Set[str]:
+    def arm_signatures(self) -> FrozenSet[str]:
         """Returns signatures of arms generated by this run."""
-        return {cw.arm.signature for cw in self._arm_weight_table.values()}
+        return self._arm_signatures
 
     @property
     def weights(self) -> List[float]:
         """Returns weights associated with arms generated by this run."""
-        return [cw.weight for cw in self._arm_weight_table.values()]
+        return list(self._weights)
 
     @property
     def arm_weights(self) -> MutableMapping[Arm, float]:
         """Mapping from arms to weights (order matches order in
         `arms` property).
         """
-        return OrderedDict(zip(self.arms, self.weights))
+        return dict(zip(self._arms, self._weights))
 
     @property
     def generator_run_type(self) -> Optional[str]:
@@ -267,12 +401,13 @@ class GeneratorRun(SortableBase):
         if self._model_predictions is None:
             return None
 
-        predictions: Dict[str, TModelPredictArm] = {}
-        for idx, cond in enumerate(self.arms):
-            predictions[cond.signature] = extract_arm_predictions(
-                model_predictions=not_none(self._model_predictions), arm_idx=idx
-            )
-        return predictions
+        arm_predictions = extract_all_arm_predictions(
+            model_predictions=not_none(self._model_predictions),
+            num_arms=len(self._arm_weight_table),
+        )
+        # Keys of the arm weight table are the arm signatures, so there is no
+        # need to recompute them from the arms.
+        return dict(zip(self._arm_weight_table.keys(), arm_predictions))
 
     @property
     def best_arm_predictions(self) -> Optional[Tuple[Arm, Optional[TModelPredictArm]]]:
@@ -302,16 +437,18 @@ class GeneratorRun(SortableBase):
         Returns:
             pd.DataFrame: a dataframe with the generator run's arms.
         """
-        return pd.DataFrame.from_dict(
-            {a.name_or_short_signature: a.parameters for a in self.arms}, orient="index"
+        arms = self._arms
+        return pd.DataFrame(
+            [a.parameters for a in arms],
+            index=[a.name_or_short_signature for a in arms],
         )
 
     def clone(self) -> GeneratorRun:
         """Return a deep copy of a GeneratorRun."""
         cand_metadata = self.candidate_metadata_by_arm_signature
         generator_run = GeneratorRun(
-            arms=[a.clone() for a in self.arms],
-            weights=self.weights[:] if self.weights is not None else None,
+            arms=[a.clone() for a in self._arms],
+            weights=list(self._weights),
             # pyre-fixme[16]: `Optional` has no attribute `clone`.
             optimization_config=self.optimization_config.clone()
             if self.optimization_config is not None
@@ -320,43 +457,66 @@ class GeneratorRun(SortableBase):
             search_space=self.search_space.clone()
             if self.search_space is not None
             else None,
-            model_predictions=copy.deepcopy(self.model_predictions),
-            best_arm_predictions=copy.deepcopy(self.best_arm_predictions),
+            model_predictions=_copy_model_predictions(self.model_predictions)
+            if self.model_predictions is not None
+            else None,
+            best_arm_predictions=_copy_best_arm_predictions(self.best_arm_predictions)
+            if self.best_arm_predictions is not None
+            else None,
             type=self.generator_run_type,
             fit_time=self.fit_time,
             gen_time=self.gen_time,
             model_key=self._model_key,
-            model_kwargs=self._model_kwargs,
-            bridge_kwargs=self._bridge_kwargs,
+            # pyre-fixme[16]: `Optional` has no attribute `copy`.
+            model_kwargs=self._model_kwargs.copy()
+            if self._model_kwargs is not None
+            else None,
+            bridge_kwargs=self._bridge_kwargs.copy()
+            if self._bridge_kwargs is not None
+            else None,
             gen_metadata=self._gen_metadata,
-            model_state_after_gen=self._model_state_after_gen,
+            model_state_after_gen=self._model_state_after_gen.copy()
+            if self._model_state_after_gen is not None
+            else None,
             generation_step_index=self._generation_step_index,
             candidate_metadata_by_arm_signature=cand_metadata,
         )
         generator_run._time_created = self._time_created
         generator_run._index = self._index
-        generator_run._model_key = self._model_key
-        generator_run._model_kwargs = (
-            # pyre-fixme[16]: `Optional` has no attribute `copy`.
-            self._model_kwargs.copy()
-            if self._model_kwargs is not None
-            else None
-        )
-        generator_run._bridge_kwargs = (
-            self._bridge_kwargs.copy() if self._bridge_kwargs is not None else None
-        )
-        generator_run._model_state_after_gen = (
-            self._model_state_after_gen.copy()
-            if self._model_state_after_gen is not None
-            else None
-        )
         return generator_run
 
+    def _set_arm_weight_table(
+        self, arm_weight_table: Dict[str, Tuple[Arm, float]]
+    ) -> None:
+        """Sets the arm weight table, a mapping from arm signature to an
+        (arm, weight) tuple, along with the arm, weight and signature lists and
+        the total weight derived from it. The table must only be replaced
+        through this method, so that the derived values stay in sync with it.
+        """
+        self._arm_weight_table = arm_weight_table
+        self._arms: List[Arm] = [cw[0] for cw in arm_weight_table.values()]
+        self._weights: List[float] = [cw[1] for cw in arm_weight_table.values()]
+        self._arm_signatures: FrozenSet[str] = frozenset(arm_weight_table.keys())
+        self._total_weight: float = sum(self._weights)
+
+    @equality_typechecker
+    def __eq__(self, other: GeneratorRun) -> bool:
+        one_dict, other_dict = self._attribute_dict, other._attribute_dict
+        # Skip values derived from the arm weight table.
+        for derived_attr in _DERIVED_ATTRIBUTES:
+            one_dict.pop(derived_attr)
+            other_dict.pop(derived_attr)
+        # Like on Ax objects without `__slots__`, where `_db_id` only appears in
+        # `__dict__` once it is set, only compare it once set.
+        for attribute_dict in (one_dict, other_dict):
+            if attribute_dict["_db_id"] is None:
+                attribute_dict.pop("_db_id")
+        return object_attribute_dicts_equal(one_dict=one_dict, other_dict=other_dict)
+
     def __repr__(self) -> str:
         class_name = self.__class__.__name__
-        num_arms = len(self.arms)
-        total_weight = sum(self.weights)
-        return f"{class_name}({num_arms} arms, total weight {total_weight})"
+        num_arms = len(self._arms)
+        return f"{class_name}({num_arms} arms, total weight {self._total_weight})"
 
     @property
     def _unique_id(self) -> str:
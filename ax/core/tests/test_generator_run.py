@@ -5,7 +5,11 @@
 # LICENSE file in the root directory of this source tree.
 
 from ax.core.arm import Arm
-from ax.core.generator_run import GeneratorRun
+from ax.core.generator_run import (
+    GeneratorRun,
+    extract_all_arm_predictions,
+    extract_arm_predictions,
+)
 from ax.utils.common.testutils import TestCase
 from ax.utils.testing.core_stubs import (
     get_arms,
@@ -84,12 +88,31 @@ class GeneratorRunTest(TestCase):
 
     def testClone(self):
         weighted_run2 = self.weighted_run.clone()
+        self.assertEqual(self.weighted_run.time_created, weighted_run2.time_created)
         self.assertEqual(
             self.weighted_run.optimization_config, weighted_run2.optimization_config
         )
         weighted_run2.arms[0].name = "bogus_name"
         self.assertNotEqual(self.weighted_run.arms, weighted_run2.arms)
 
+        # Model predictions should be equal, but not shared with the original.
+        self.assertEqual(
+            self.weighted_run.model_predictions, weighted_run2.model_predictions
+        )
+        metric = next(iter(weighted_run2.model_predictions[0]))
+        weighted_run2.model_predictions[0][metric][0] += 1.0
+        weighted_run2.model_predictions[1][metric][metric][0] += 1.0
+        self.assertEqual(self.weighted_run.model_predictions, get_model_predictions())
+
+        best_arm_predictions = (self.arms[0], ({"a": 1.0}, {"a": {"a": 2.0}}))
+        generator_run = GeneratorRun(
+            arms=self.arms, best_arm_predictions=best_arm_predictions
+        )
+        cloned_best_arm_predictions = generator_run.clone().best_arm_predictions
+        self.assertEqual(cloned_best_arm_predictions, best_arm_predictions)
+        self.assertIsNot(cloned_best_arm_predictions[0], self.arms[0])
+        self.assertIsNot(cloned_best_arm_predictions[1][1], best_arm_predictions[1][1])
+
     def testMergeDuplicateArm(self):
         arms = self.arms + [self.arms[0]]
         run = GeneratorRun(
@@ -99,6 +122,24 @@ class GeneratorRunTest(TestCase):
             model_predictions=self.model_predictions,
         )
         self.assertEqual(str(run), GENERATOR_RUN_STR_PLUS_1)
+        self.assertEqual(run.arms, self.arms)
+        self.assertEqual(run.weights, [2.0, 1.0, 1.0])
+
+    def testArmsAndWeights(self):
+        self.assertEqual(self.weighted_run.arms, self.arms)
+        self.assertEqual(self.weighted_run.weights, self.weights)
+        self.assertEqual(
+            self.weighted_run.arm_signatures, {arm.signature for arm in self.arms}
+        )
+        self.assertIsInstance(self.weighted_run.arm_signatures, frozenset)
+        self.assertEqual(
+            self.weighted_run.arm_weights, dict(zip(self.arms, self.weights))
+        )
+        # Returned lists are copies, so modifying them does not affect the run.
+        self.weighted_run.arms.append(Arm(parameters={"w": 0.0}))
+        self.weighted_run.weights[0] = 5.0
+        self.assertEqual(self.weighted_run.arms, self.arms)
+        self.assertEqual(self.weighted_run.weights, self.weights)
 
     def testIndex(self):
         self.assertIsNone(self.unweighted_run.index)
@@ -112,6 +153,17 @@ class GeneratorRunTest(TestCase):
             self.unweighted_run.model_predictions_by_arm,
             get_model_predictions_per_arm(),
         )
+        self.assertEqual(self.unweighted_run, self.unweighted_run.clone())
+        # Predictions by arm are extracted on every access, so they reflect
+        # changes to model predictions.
+        means = self.unweighted_run.model_predictions[0]
+        metric = next(iter(means))
+        means[metric][0] = 123.0
+        arm_signature = self.arms[0].signature
+        self.assertEqual(
+            self.unweighted_run.model_predictions_by_arm[arm_signature][0][metric],
+            123.0,
+        )
         run_no_model_predictions = GeneratorRun(
             arms=self.arms,
             weights=self.weights,
@@ -121,8 +173,41 @@ class GeneratorRunTest(TestCase):
         self.assertIsNone(run_no_model_predictions.model_predictions)
         self.assertIsNone(run_no_model_predictions.model_predictions_by_arm)
 
+    def testExtractAllArmPredictions(self):
+        all_arm_predictions = extract_all_arm_predictions(
+            model_predictions=self.model_predictions, num_arms=len(self.arms)
+        )
+        self.assertEqual(
+            all_arm_predictions,
+            [
+                extract_arm_predictions(
+                    model_predictions=self.model_predictions, arm_idx=idx
+                )
+                for idx in range(len(self.arms))
+            ],
+        )
+        self.assertEqual(
+            extract_all_arm_predictions(model_predictions=({}, {}), num_arms=2),
+            [({}, {}), ({}, {})],
+        )
+
     def testEq(self):
         self.assertEqual(self.unweighted_run, self.unweighted_run)
+        # Attributes are stored in slots, but still compared.
+        self.assertFalse(hasattr(self.unweighted_run, "__dict__"))
+        self.assertEqual(
+            self.unweighted_run._attribute_dict["_fit_time"],
+            self.unweighted_run.fit_time,
+        )
+        self.assertNotEqual(
+            self.unweighted_run,
+            GeneratorRun(arms=self.arms, model_predictions=self.model_predictions),
+        )
+        # `_db_id` is only compared once it is set, as with other Ax objects.
+        self.assertIsNone(self.unweighted_run.db_id)
+        saved_run = self.unweighted_run.clone()
+        saved_run.db_id = 1
+        self.assertEqual(self.unweighted_run, saved_run)
 
         arms = [
             Arm(parameters={"w": 0.5, "x": 15, "y": "foo", "z": False}),
@@ -138,6 +223,10 @@ class GeneratorRunTest(TestCase):
     def testParamDf(self):
         param_df = self.unweighted_run.param_df
         self.assertEqual(len(param_df), len(self.arms))
+        self.assertEqual(
+            list(param_df.index), [a.name_or_short_signature for a in self.arms]
+        )
+        self.assertEqual(param_df.iloc[0].to_dict(), self.arms[0].parameters)
 
     def testBestArm(self):
         generator_run = GeneratorRun(
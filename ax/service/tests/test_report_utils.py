@@ -71,6 +71,9 @@ class ReportUtilsTest(TestCase):
         self.assertTrue(all(x == "RUNNING" for x in df.trial_status))
         self.assertTrue(all(x == "Sobol" for x in df.generator_model))
         self.assertTrue(all(x == "branin_test_experiment_0" for x in df.name))
+        arms = [exp.arms_by_name[arm_name] for arm_name in df.arm_name]
+        self.assertEqual(list(df.x1), [arm.parameters["x1"] for arm in arms])
+        self.assertEqual(list(df.x2), [arm.parameters["x2"] for arm in arms])
         # works correctly for failed trials (will need to mock)
         dummy_struct = namedtuple("dummy_struct", "df")
         mock_results = dummy_struct(
@@ -107,6 +110,12 @@ class ReportUtilsTest(TestCase):
         best_trial = get_best_trial(exp)
         pd.testing.assert_frame_equal(df.sort_values("branin").head(1), best_trial)
 
+        exp.optimization_config.objective.minimize = False
+        best_trial = get_best_trial(exp)
+        pd.testing.assert_frame_equal(
+            df.sort_values("branin", ascending=False).head(1), best_trial
+        )
+
     def test_get_shortest_unique_suffix_dict(self):
         expected_output = {
             "abc.123": "abc.123",
@@ -120,6 +129,28 @@ class ReportUtilsTest(TestCase):
             ["abc.123", "abc.456", "def.123", "asdf.abc.123", "", "no_delimiter"]
         )
         self.assertDictEqual(expected_output, actual_output)
+        # Strings sharing several trailing chunks need more than one extra chunk.
+        self.assertDictEqual(
+            _get_shortest_unique_suffix_dict(["a.x.y.z", "b.x.y.z", "c.w.y.z", "v.z"]),
+            {
+                "a.x.y.z": "a.x.y.z",
+                "b.x.y.z": "b.x.y.z",
+                "c.w.y.z": "w.y.z",
+                "v.z": "v.z",
+            },
+        )
+        self.assertDictEqual(
+            _get_shortest_unique_suffix_dict(["metric_a", "metric_b"], delim="_"),
+            {"metric_a": "a", "metric_b": "b"},
+        )
+        self.assertDictEqual(_get_shortest_unique_suffix_dict([]), {})
+        self.assertDictEqual(
+            _get_shortest_unique_suffix_dict(["abc.123"]), {"abc.123": "123"}
+        )
+        self.assertDictEqual(
+            _get_shortest_unique_suffix_dict(["abc.123", "asdf.abc.123"]),
+            {"abc.123": "abc.123", "asdf.abc.123": "asdf.abc.123"},
+        )
 
     def test_get_standard_plots(self):
         exp = get_branin_experiment()
@@ -138,6 +169,9 @@ class ReportUtilsTest(TestCase):
             experiment=exp,
             data=exp.fetch_data(),
         )
-        plots = get_standard_plots(experiment=exp, generation_strategy=gs)
+        with patch.object(exp, "fetch_data", wraps=exp.fetch_data) as mock_fetch_data:
+            plots = get_standard_plots(experiment=exp, generation_strategy=gs)
+        # Data should only be fetched once.
+        mock_fetch_data.assert_called_once()
         self.assertEqual(len(plots), 4)
         self.assertTrue(all(isinstance(plot, go.Figure) for plot in plots))
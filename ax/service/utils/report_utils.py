@@ -6,7 +6,6 @@
 
 # pyre-strict
 
-from collections import defaultdict
 from logging import Logger
 from typing import Any, Dict, List, Optional
 
@@ -41,12 +40,13 @@ def _get_cross_validation_plot(model: ModelBridge) -> go.Figure:
 
 
 def _get_objective_trace_plot(
-    experiment: Experiment,
+    data_df: pd.DataFrame,
     metric_name: str,
     model_transitions: List[int],
     optimization_direction: Optional[str] = None,
 ) -> Optional[go.Figure]:
-    best_objectives = np.array([experiment.fetch_data().df["mean"]])
+    # A 2-D view of the means, as a single run, rather than a copy.
+    best_objectives = data_df["mean"].to_numpy()[np.newaxis, :]
     return optimization_trace_single_method_plotly(
         y=best_objectives,
         title="Best objective found vs. # of iterations",
@@ -117,43 +117,50 @@ def _get_shortest_unique_suffix_dict(
     assert len(input_str_list) == len(set(input_str_list))
     if delim == "":
         raise ValueError("delim must be a non-empty string.")
-    suffix_dict = defaultdict(list)
-    # initialize suffix_dict with last chunk
-    for istr in input_str_list:
-        suffix_dict[_get_suffix(istr, delim=delim, n_chunks=1)].append(istr)
-    max_chunks = max(len(istr.split(delim)) for istr in input_str_list)
-    if max_chunks == 1:
-        return {istr: istr for istr in input_str_list}
-    # the upper range of this loop is `max_chunks + 2` because:
-    #     - `i` needs to take the value of `max_chunks`, hence one +1
-    #     - the contents of the loop are run one more time to check if `all_unique`,
-    #           hence the other +1
-    for i in range(2, max_chunks + 2):
-        new_dict = defaultdict(list)
-        all_unique = True
-        for suffix, suffix_str_list in suffix_dict.items():
-            if len(suffix_str_list) > 1:
-                all_unique = False
-                for istr in suffix_str_list:
-                    new_dict[_get_suffix(istr, delim=delim, n_chunks=i)].append(istr)
-            else:
-                new_dict[suffix] = suffix_str_list
-        if all_unique:
-            if len(set(input_str_list)) != len(suffix_dict.keys()):
-                break
-            return {
-                suffix_str_list[0]: suffix
-                for suffix, suffix_str_list in suffix_dict.items()
-            }
-        suffix_dict = new_dict
-    # If this function has not yet exited, some input strings still share a suffix.
-    # This is not expected, but in this case, the function will return the identity
-    # mapping, i.e., a dict with the original strings as both keys and values.
-    logger.warning(
-        "Something went wrong. Returning dictionary with original strings as keys and "
-        "values."
-    )
-    return {istr: istr for istr in input_str_list}
+    # A single string, e.g. a lone objective metric, is always its last chunk.
+    if len(input_str_list) <= 1:
+        return {istr: _get_suffix(istr, delim=delim) for istr in input_str_list}
+    # Split every string into chunks once, reversed so that shared suffixes
+    # become shared prefixes.
+    reversed_chunks = [istr.split(delim)[::-1] for istr in input_str_list]
+    # In the common case the last chunks are already unique, and no string needs
+    # more than one chunk.
+    last_chunks = [chunks[0] for chunks in reversed_chunks]
+    if len(set(last_chunks)) == len(last_chunks):
+        return dict(zip(input_str_list, last_chunks))
+    # Two strings only need to be compared with each other.
+    if len(input_str_list) == 2:
+        n_common = _get_common_prefix_length(*reversed_chunks)
+        return {
+            istr: delim.join(chunks[: n_common + 1][::-1])
+            for istr, chunks in zip(input_str_list, reversed_chunks)
+        }
+    # Once sorted, the longest common prefix that a string shares with any other
+    # string is the one it shares with one of its neighbors.
+    order = sorted(range(len(input_str_list)), key=lambda i: reversed_chunks[i])
+    # A string needs one more chunk than it shares with its most similar string
+    # to be distinguished from all others.
+    n_chunks = [1] * len(input_str_list)
+    for left, right in zip(order, order[1:]):
+        n_common = _get_common_prefix_length(
+            reversed_chunks[left], reversed_chunks[right]
+        )
+        n_chunks[left] = max(n_chunks[left], n_common + 1)
+        n_chunks[right] = max(n_chunks[right], n_common + 1)
+    return {
+        istr: delim.join(chunks[:n][::-1])
+        for istr, chunks, n in zip(input_str_list, reversed_chunks, n_chunks)
+    }
+
+
+def _get_common_prefix_length(first: List[str], second: List[str]) -> int:
+    """Returns the number of leading elements that two lists have in common."""
+    length = 0
+    for first_element, second_element in zip(first, second):
+        if first_element != second_element:
+            break
+        length += 1
+    return length
 
 
 def get_standard_plots(
@@ -196,26 +203,25 @@ def get_standard_plots(
             "optimization experiments. Returning an empty list."
         )
         return []
+    metric_name = objective.metric.name
 
-    if experiment.fetch_data().df.empty:
+    # Fetch data once and reuse it, since fetching can be expensive.
+    data_df = experiment.fetch_data().df
+    if data_df.empty:
         logger.info(f"Experiment {experiment} does not yet have data, nothing to plot.")
         return []
 
     output_plot_list = []
     output_plot_list.append(
         _get_objective_trace_plot(
-            experiment=experiment,
-            metric_name=not_none(experiment.optimization_config).objective.metric.name,
+            data_df=data_df,
+            metric_name=metric_name,
             # TODO: Adjust `model_transitions` to case where custom trials are present
             # and generation strategy does not start right away.
             model_transitions=not_none(generation_strategy).model_transitions
             if generation_strategy is not None
             else [],
-            optimization_direction=(
-                "minimize"
-                if not_none(experiment.optimization_config).objective.minimize
-                else "maximize"
-            ),
+            optimization_direction="minimize" if objective.minimize else "maximize",
         )
     )
 
@@ -229,9 +235,7 @@ def get_standard_plots(
                 _get_objective_v_param_plot(
                     search_space=experiment.search_space,
                     model=model,
-                    metric_name=not_none(
-                        experiment.optimization_config
-                    ).objective.metric.name,
+                    metric_name=metric_name,
                     trials=experiment.trials,
                 )
             )
@@ -271,25 +275,31 @@ def exp_to_df(
         available, returns a dataframe of inputs and metadata.
     """
 
-    def prep_return(
-        df: pd.DataFrame, drop_col: str, sort_by: List[str]
-    ) -> pd.DataFrame:
-        return not_none(not_none(df.drop(drop_col, axis=1)).sort_values(sort_by))
-
     # Accept Experiment and SimpleExperiment
     if isinstance(exp, MultiTypeExperiment):
         raise ValueError("Cannot transform MultiTypeExperiments to DataFrames.")
 
     key_components = ["trial_index", "arm_name"]
 
-    # Get each trial-arm with parameters
-    arms_df = pd.DataFrame()
-    for trial_index, trial in exp.trials.items():
-        for arm in trial.arms:
-            arms_df = arms_df.append(
-                {"arm_name": arm.name, "trial_index": trial_index, **arm.parameters},
-                ignore_index=True,
-            )
+    # Get each trial-arm with parameters, collecting values column by column
+    trial_arms = [
+        (trial_index, arm)
+        for trial_index, trial in exp.trials.items()
+        for arm in trial.arms
+    ]
+    param_names = list(
+        dict.fromkeys(name for _, arm in trial_arms for name in arm.parameters)
+    )
+    arms_df = pd.DataFrame(
+        {
+            "arm_name": [arm.name for _, arm in trial_arms],
+            "trial_index": [trial_index for trial_index, _ in trial_arms],
+            **{
+                name: [arm.parameters.get(name) for _, arm in trial_arms]
+                for name in param_names
+            },
+        }
+    )
 
     # Fetch results; in case arms_df is empty, return empty results (legacy behavior)
     results = exp.fetch_data(metrics, **kwargs).df
@@ -302,79 +312,56 @@ def exp_to_df(
             )
         return results
 
-    # Create key column from key_components
-    arms_df["trial_index"] = arms_df["trial_index"].astype(int)
-    key_col = "-".join(key_components)
-    key_vals = arms_df[key_components[0]].astype("str") + arms_df[
-        key_components[1]
-    ].astype("str")
-    arms_df[key_col] = key_vals
-
-    # Add trial status
-    trials = exp.trials.items()
-    trial_to_status = {index: trial.status.name for index, trial in trials}
-    arms_df["trial_status"] = [
-        trial_to_status[trial_index] for trial_index in arms_df.trial_index
-    ]
+    if run_metadata_fields is not None and not (
+        isinstance(run_metadata_fields, list)
+        and all(isinstance(field, str) for field in run_metadata_fields)
+    ):
+        raise ValueError(
+            f"run_metadata_fields must be List[str] or None. Got {run_metadata_fields}"
+        )
 
-    # Add and generator_run model keys
-    arms_df["generator_model"] = [
+    # Collect trial status, generator_run model keys and run_metadata fields in a
+    # single pass over the trials
+    trial_to_status = {}
+    trial_to_generator_model = {}
+    field_to_trial_to_value = {field: {} for field in run_metadata_fields or []}
+    for index, trial in exp.trials.items():
+        trial_to_status[index] = trial.status.name
         # This accounts for the generic case that generator_runs is a list of arbitrary
         # length. If all elements are `None`, this yields an empty string. Repeated
         # generator models within a trial are condensed via a set comprehension.
-        ", ".join(
+        generator_model = ", ".join(
             {
                 not_none(generator_run._model_key)
-                for generator_run in exp.trials[trial_index].generator_runs
+                for generator_run in trial.generator_runs
                 if generator_run._model_key is not None
             }
         )
-        if trial_index in exp.trials
-        else ""
-        for trial_index in arms_df.trial_index
-    ]
+        # replace all unknown generator_models (denoted by empty strings) with "Unknown"
+        trial_to_generator_model[index] = generator_model or "Unknown"
+        for field, trial_to_value in field_to_trial_to_value.items():
+            trial_to_value[index] = trial.run_metadata.get(field)
 
-    # replace all unknown generator_models (denoted by empty strings) with "Unknown"
-    arms_df["generator_model"] = [
-        "Unknown" if generator_model == "" else generator_model
-        for generator_model in arms_df["generator_model"]
-    ]
+    # Add trial status and generator_run model keys
+    arms_df["trial_status"] = arms_df["trial_index"].map(trial_to_status)
+    arms_df["generator_model"] = arms_df["trial_index"].map(trial_to_generator_model)
 
     # Add any run_metadata fields to arms_df
-    if run_metadata_fields is not None:
-        if not (
-            isinstance(run_metadata_fields, list)
-            and all(isinstance(field, str) for field in run_metadata_fields)
-        ):
-            raise ValueError(
-                "run_metadata_fields must be List[str] or None. "
-                f"Got {run_metadata_fields}"
-            )
-
-        # add additional run_metadata fields
-        for field in run_metadata_fields:
-            trial_to_metadata_field = {
-                index: (
-                    trial.run_metadata[field] if field in trial.run_metadata else None
-                )
-                for index, trial in trials
-            }
-            if any(trial_to_metadata_field.values()):  # field present for any trial
-                if not all(
-                    trial_to_metadata_field.values()
-                ):  # not present for all trials
-                    logger.warning(
-                        f"Field {field} missing for some trials' run_metadata. "
-                        "Returning None when missing."
-                    )
-                arms_df[field] = [
-                    trial_to_metadata_field[key] for key in arms_df.trial_index
-                ]
-            else:
+    metadata_cols = {}
+    for field, trial_to_metadata_field in field_to_trial_to_value.items():
+        if any(trial_to_metadata_field.values()):  # field present for any trial
+            if not all(trial_to_metadata_field.values()):  # not present for all trials
                 logger.warning(
-                    f"Field {field} missing for all trials' run_metadata. "
-                    "Not appending column."
+                    f"Field {field} missing for some trials' run_metadata. "
+                    "Returning None when missing."
                 )
+            metadata_cols[field] = arms_df["trial_index"].map(trial_to_metadata_field)
+        else:
+            logger.warning(
+                f"Field {field} missing for all trials' run_metadata. "
+                "Not appending column."
+            )
+    arms_df = arms_df.assign(**metadata_cols)
 
     if len(results.index) == 0:
         logger.info(
@@ -389,24 +376,18 @@ def exp_to_df(
         )
         exp_df = arms_df
     else:
-        # prepare results for merge
-        key_vals = results[key_components[0]].astype("str") + results[
-            key_components[1]
-        ].astype("str")
-        results[key_col] = key_vals
-        metric_vals = results.pivot(
-            index=key_col, columns="metric_name", values="mean"
-        ).reset_index()
-
-        # dedupe results by key_components
-        metadata = results[key_components + [key_col]].drop_duplicates()
-        metrics_df = pd.merge(metric_vals, metadata, on=key_col)
+        # pivot metric means into one column per metric, keyed by key_components;
+        # like `pivot`, this raises if results hold duplicate entries for a key
+        metric_vals = results.set_index(key_components + ["metric_name"])[
+            "mean"
+        ].unstack()
+        metrics_df = metric_vals.reset_index()[
+            list(metric_vals.columns) + key_components
+        ]
 
         # merge and return
-        exp_df = pd.merge(
-            metrics_df, arms_df, on=key_components + [key_col], how="outer"
-        )
-    return prep_return(df=exp_df, drop_col=key_col, sort_by=["arm_name"])
+        exp_df = pd.merge(metrics_df, arms_df, on=key_components, how="outer")
+    return not_none(exp_df.sort_values(["arm_name"]))
 
 
 def get_best_trial(
@@ -469,7 +450,6 @@ def get_best_trial(
         )
         return None
 
-    metric_optimum = (
-        trials_df[metric_name].min() if minimize else trials_df[metric_name].max()
-    )
-    return pd.DataFrame(trials_df[trials_df[metric_name] == metric_optimum].head(1))
+    if minimize:
+        return trials_df.nsmallest(1, metric_name)
+    return trials_df.nlargest(1, metric_name)
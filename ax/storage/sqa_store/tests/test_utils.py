@@ -3,6 +3,8 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
+from unittest.mock import patch
+
 from ax.storage.sqa_store.db import (
     init_test_engine_and_session_factory,
 )
@@ -17,6 +19,7 @@ from ax.utils.common.testutils import TestCase
 from ax.utils.testing.core_stubs import (
     get_experiment_with_batch_trial,
     get_experiment_with_data,
+    get_generator_run,
 )
 
 
@@ -61,3 +64,19 @@ class SQAStoreUtilsTest(TestCase):
         save_experiment(exp)
 
         self.assertNotEqual(exp.trials[0].arms[0].db_id, exp.trials[1].arms[0].db_id)
+
+    def testCopyDBIDsGeneratorRun(self):
+        generator_run = get_generator_run()
+        generator_run.db_id = 1
+        target = generator_run.clone()
+
+        with patch(
+            f"{copy_db_ids.__module__}.copy_db_ids", wraps=copy_db_ids
+        ) as mock_copy_db_ids:
+            copy_db_ids(generator_run, target)
+        self.assertEqual(target.db_id, 1)
+        # Attributes derived from the arm weight table are not traversed.
+        traversed_attrs = {call[0][2][0] for call in mock_copy_db_ids.call_args_list}
+        self.assertIn("_arm_weight_table", traversed_attrs)
+        self.assertNotIn("_arms", traversed_attrs)
+        self.assertNotIn("_weights", traversed_attrs)
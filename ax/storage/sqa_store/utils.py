@@ -7,6 +7,7 @@
 from typing import Any, List, Optional
 
 from ax.core.experiment import Experiment
+from ax.core.generator_run import _DERIVED_ATTRIBUTES, GeneratorRun
 from ax.exceptions.storage import SQADecodeError
 from ax.utils.common.base import Base, SortableBase
 
@@ -46,7 +47,7 @@ def copy_db_ids(source: Any, target: Any, path: Optional[List[str]] = None) -> N
             )
 
     if isinstance(source, Base):
-        for attr, val in source.__dict__.items():
+        for attr, val in source._attribute_dict.items():
             if attr.endswith("_db_id"):
                 # we're at a "leaf" node; copy the db_id and return
                 setattr(target, attr, val)
@@ -87,6 +88,11 @@ def copy_db_ids(source: Any, target: Any, path: Optional[List[str]] = None) -> N
             }:
                 continue
 
+            # Skip values derived from a generator run's arm weight table; they
+            # carry no db_ids of their own.
+            if isinstance(source, GeneratorRun) and attr in _DERIVED_ATTRIBUTES:
+                continue
+
             copy_db_ids(val, getattr(target, attr), path + [attr])
 
     elif isinstance(source, (list, set)):
@@ -7,7 +7,7 @@
 from __future__ import annotations
 
 import abc
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from ax.utils.common.equality import equality_typechecker, object_attribute_dicts_equal
 
@@ -15,8 +15,14 @@ from ax.utils.common.equality import equality_typechecker, object_attribute_dict
 class Base:
     """Metaclass for core Ax classes. Provides an equality check and `db_id`
     property for SQA storage.
+
+    NOTE: Declares empty `__slots__`, so that subclasses can opt into storing
+    their attributes in `__slots__`. Subclasses that do not declare
+    `__slots__` still get a regular instance `__dict__`.
     """
 
+    __slots__ = ()
+
     _db_id: Optional[int] = None
 
     @property
@@ -27,16 +33,30 @@ class Base:
     def db_id(self, db_id: int) -> None:
         self._db_id = db_id
 
+    @property
+    def _attribute_dict(self) -> Dict[str, Any]:
+        """Mapping from attribute name to value for all attributes set on this
+        instance, whether they are stored in its `__dict__` or in `__slots__`.
+        """
+        attribute_dict = dict(getattr(self, "__dict__", {}))
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if name not in ("__dict__", "__weakref__") and hasattr(self, name):
+                    attribute_dict[name] = getattr(self, name)
+        return attribute_dict
+
     @equality_typechecker
     def __eq__(self, other: Base) -> bool:
         return object_attribute_dicts_equal(
-            one_dict=self.__dict__, other_dict=other.__dict__
+            one_dict=self._attribute_dict, other_dict=other._attribute_dict
         )
 
 
 class SortableBase(Base, metaclass=abc.ABCMeta):
     """Extension to the base class that also provides an inequality check."""
 
+    __slots__ = ()
+
     @property
     @abc.abstractmethod
     def _unique_id(self) -> str:
@@ -175,8 +175,8 @@ def _build_comparison_str(
     msg = ""
     indent = " " * level * 4
     _, unequal_val = object_attribute_dicts_find_unequal_fields(
-        one_dict=first.__dict__ if isinstance(first, Base) else first,
-        other_dict=second.__dict__ if isinstance(second, Base) else second,
+        one_dict=first._attribute_dict if isinstance(first, Base) else first,
+        other_dict=second._attribute_dict if isinstance(second, Base) else second,
         fast_return=False,
     )
     if level == 0: